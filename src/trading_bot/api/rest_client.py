@@ -5,15 +5,46 @@ rate limiting, retry logic, and exponential backoff.
 Enhanced with robust pagination supporting 10,000+ candle fetching.
 """
 
+import json
 import time
+import threading
 from typing import List, Dict, Any, Optional
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup
+    _json_loads = json.loads
 
 from trading_bot.core.logger import get_logger
 from trading_bot.config.app.models import AppConfig
 
 
+# Columnar (structured) candle layout used by bulk paths.
+CANDLE_DTYPE = np.dtype([
+    ("open_ts", "i8"),
+    ("close_ts", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+
+def candles_to_array(candles: List[Dict[str, Any]]) -> np.ndarray:
+    """Convert normalized candle dicts into a CANDLE_DTYPE structured array."""
+    n = len(candles)
+    arr = np.empty(n, dtype=CANDLE_DTYPE)
+    for name in CANDLE_DTYPE.names:
+        # fromiter fills a typed buffer directly (no intermediate list of boxed values)
+        arr[name] = np.fromiter((c[name] for c in candles), dtype=CANDLE_DTYPE[name], count=n)
+    return arr
+
+
 class RestClient:
     """
     Binance REST API client with:
@@ -28,6 +59,8 @@ class RestClient:
     Key Features:
     - fetch_klines(symbol, timeframe, limit, start_time, end_time)
       returns up to `limit` normalized candles (oldest -> newest)
+    - fetch_klines_array(...) returns the same candles as a CANDLE_DTYPE
+      structured array for bulk consumers
     - Automatic pagination for limit > 1000
     - Order-independent window movement using raw Binance openTime
     - Proper deduplication and alignment checks
@@ -49,9 +82,25 @@ class RestClient:
         # Delay between pagination requests to be polite (can be tuned)
         self.per_request_delay = float(getattr(app_config.candles, "per_request_delay", 0.12))
 
+        # One persistent keep-alive session shared by every fetch. The pool is
+        # sized for the parallel bootstrap fan-out so concurrent workers reuse
+        # warm TCP+TLS connections instead of opening new ones. Retries stay in
+        # _request_with_retry (429/5xx handling), not in the adapter.
+        pool_size = int(getattr(app_config.candles, "http_pool_size", 32))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
         self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; TradingBot/1.0)"})
 
+        # Client-wide cap on requests in flight (bootstrap fan-out + WS gap fills)
+        self.max_concurrent_requests = max(1, int(getattr(app_config.candles, "max_concurrent_requests", 16)))
+        self._inflight = threading.BoundedSemaphore(self.max_concurrent_requests)
+
+        # timeframe -> interval seconds, resolved once per timeframe
+        self._tf_seconds_cache: Dict[str, int] = {}
+
     # --------------------------
     # Public
     # --------------------------
@@ -62,19 +111,75 @@ class RestClient:
         limit: int = 500,
         start_time: Optional[int] = None,  # milliseconds
         end_time: Optional[int] = None,    # milliseconds
+        now: Optional[int] = None,         # seconds
     ) -> List[Dict[str, Any]]:
         """
         Fetch klines, auto-paginating when limit > 1000.
         Returns candles oldest -> newest (ts=open_ts in seconds).
         `start_time` and `end_time` are milliseconds (Binance API).
         If both None, this fetches most recent `limit` closed candles (uses current time ceiling).
+        `now` (seconds) sets that ceiling explicitly (single request or paginated),
+        so callers fetching several timeframes can share one reference time.
+        """
+        raw = self._fetch_raw(symbol, timeframe, limit, start_time, end_time, now)
+        if not raw:
+            return []
+        normalized = self._normalize_klines(raw)
+        return self._sanitize_candles(normalized, timeframe, limit=limit)
+
+    def fetch_klines_array(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        start_time: Optional[int] = None,  # milliseconds
+        end_time: Optional[int] = None,    # milliseconds
+        now: Optional[int] = None,         # seconds
+    ) -> np.ndarray:
         """
+        Same as fetch_klines, but returns a CANDLE_DTYPE structured array
+        (oldest -> newest) instead of a list of dicts.
+
+        Used by bulk paths (bootstrap → DuckDB) that never need per-candle
+        dicts: columns stay contiguous and no dict is built per candle.
+        """
+        raw = self._fetch_raw(symbol, timeframe, limit, start_time, end_time, now)
+        arr = self._klines_to_array(raw or [])
+        if not arr.size:
+            return arr
+        return arr[self._sanitize_ts(arr["open_ts"], timeframe, limit)]
+
+    def _fetch_raw(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        start_time: Optional[int],
+        end_time: Optional[int],
+        now: Optional[int] = None,
+    ) -> Optional[List[List[Any]]]:
         if limit <= 1000:
-            raw = self._fetch_single_batch(symbol, timeframe, limit, start_time, end_time)
-            return self._normalize_and_validate(raw, timeframe)
+            # Pin the single request to the caller's reference time; without
+            # `now`, Binance's own clock decides the most recent candle
+            if start_time is None and end_time is None and now is not None:
+                end_time = self._ceiling_ms(timeframe, now)
+            return self._fetch_single_batch(symbol, timeframe, limit, start_time, end_time)
 
         # pagination for >1000
-        return self._fetch_with_pagination(symbol, timeframe, limit, start_time, end_time)
+        return self._fetch_with_pagination(symbol, timeframe, limit, start_time, end_time, now)
+
+    def _tf_seconds(self, timeframe: str) -> int:
+        tf_sec = self._tf_seconds_cache.get(timeframe)
+        if tf_sec is None:
+            tf_sec = self._tf_seconds_cache[timeframe] = self.app_config.get_timeframe_seconds(timeframe)
+        return tf_sec
+
+    def _ceiling_ms(self, timeframe: str, now: Optional[int] = None) -> int:
+        """Open time (ms) of the candle containing `now` (seconds, default wall clock)."""
+        if now is None:
+            now = time.time_ns() // 1_000_000_000
+        tf_sec = self._tf_seconds(timeframe)
+        return (now // tf_sec) * tf_sec * 1000
 
     # --------------------------
     # Single batch
@@ -109,22 +214,22 @@ class RestClient:
         limit: int,
         start_time: Optional[int],
         end_time: Optional[int],
-    ) -> List[Dict[str, Any]]:
+        now: Optional[int] = None,
+    ) -> List[List[Any]]:
         """
         Robust pagination:
          - If end_time is provided (ms) we page *backwards* from end_time (most recent).
          - Otherwise we page forwards starting at start_time if given, or
            we compute an end_time = closed_ceiling and page backwards to get most recent candles.
-        Returns up to `limit` normalized candles (oldest -> newest).
+        Returns the raw kline rows of every page (unordered, may overlap);
+        callers dedupe, order and trim to the newest `limit`.
         """
-        tf_sec = self.app_config.get_timeframe_seconds(timeframe)
+        tf_sec = self._tf_seconds(timeframe)
         tf_ms = tf_sec * 1000
 
         # If neither provided, set end_time to last fully closed candle (ms)
         if start_time is None and end_time is None:
-            now = int(time.time())
-            closed_ceiling_open_ts = (now // tf_sec) * tf_sec  # seconds
-            end_time = closed_ceiling_open_ts * 1000
+            end_time = self._ceiling_ms(timeframe, now)
 
         direction_backwards = end_time is not None
 
@@ -179,22 +284,7 @@ class RestClient:
             # small delay between paged requests
             time.sleep(self.per_request_delay)
 
-        # Normalize & dedupe by open_ts
-        normalized = self._normalize_klines(all_raw)
-        # Build unique by open_ts (ts)
-        unique_map = {c["open_ts"]: c for c in normalized}
-        cleaned = list(unique_map.values())
-        cleaned.sort(key=lambda x: x["open_ts"])
-
-        # If we paged backwards to get most recent N, cleaned now contains all candidate candles oldest->newest.
-        # Return the last `limit` items (most recent N) to match expectation.
-        if len(cleaned) > limit:
-            cleaned = cleaned[-limit:]
-
-        # Final alignment check
-        self._check_alignment(cleaned, timeframe)
-
-        return cleaned
+        return all_raw
 
     # --------------------------
     # Exact fetch
@@ -204,7 +294,7 @@ class RestClient:
         Fetch exact candle by open timestamp (seconds).
         Returns normalized candle dict or None.
         """
-        tf_sec = self.app_config.get_timeframe_seconds(timeframe)
+        tf_sec = self._tf_seconds(timeframe)
         start_ms = open_ts * 1000
         end_ms = (open_ts + tf_sec) * 1000 - 1
 
@@ -233,7 +323,7 @@ class RestClient:
         -------
         List of normalized candles between the timestamps
         """
-        tf_sec = self.app_config.get_timeframe_seconds(timeframe)
+        tf_sec = self._tf_seconds(timeframe)
         
         # Calculate how many candles we need
         gap_seconds = end_ts - start_ts
@@ -287,7 +377,8 @@ class RestClient:
         for attempt in range(1, self.max_retries + 1):
             start_t = time.time()
             try:
-                resp = self.session.get(url, params=params, timeout=self.request_timeout)
+                with self._inflight:
+                    resp = self.session.get(url, params=params, timeout=self.request_timeout)
                 duration = time.time() - start_t
 
                 if resp.status_code == 429:
@@ -305,7 +396,7 @@ class RestClient:
                     continue
 
                 resp.raise_for_status()
-                data = resp.json()
+                data = _json_loads(resp.content)
                 if isinstance(data, list):
                     return data
                 self.logger.error(f"[RestClient] Unexpected response format for {context}: {type(data)}")
@@ -351,7 +442,9 @@ class RestClient:
             11 ignore
         ]
         """
-        candles: List[Dict[str, Any]] = []
+        # Pre-sized; rows that fail to normalize are trimmed off the end
+        candles: List[Dict[str, Any]] = [None] * len(raw)
+        n = 0
         
         for k in raw:
             try:
@@ -360,7 +453,7 @@ class RestClient:
                 open_ts = open_ms // 1000
                 close_ts = close_ms // 1000
                 
-                candles.append({
+                candles[n] = {
                     # MASTER TIME INDEX (open_ts) — safe for LM & CandleSync
                     "open_ts": open_ts,
                     "close_ts": close_ts,
@@ -376,33 +469,98 @@ class RestClient:
                     "trades": int(k[8]) if len(k) > 8 else 0,
                     "taker_buy_base": float(k[9]) if len(k) > 9 else 0.0,
                     "taker_buy_quote": float(k[10]) if len(k) > 10 else 0.0,
-                })
+                }
+                n += 1
             except Exception as e:
                 self.logger.error(f"[RestClient] Kline normalization error: {e}")
                 continue
                 
+        del candles[n:]
         return candles
 
-    def _normalize_and_validate(self, raw: Optional[List[List[Any]]], timeframe: str) -> List[Dict[str, Any]]:
+    def _klines_to_array(self, raw: List[List[Any]]) -> np.ndarray:
+        """
+        Convert raw Binance kline rows straight into a CANDLE_DTYPE array.
+        Prices arrive as strings; NumPy parses whole columns in C.
+        Falls back to per-row normalization if any row is malformed.
+        """
+        arr = np.empty(len(raw), dtype=CANDLE_DTYPE)
         if not raw:
+            return arr
+
+        try:
+            table = np.array([k[:7] for k in raw], dtype=np.float64)
+            arr["open_ts"] = table[:, 0].astype(np.int64) // 1000
+            arr["close_ts"] = table[:, 6].astype(np.int64) // 1000
+            for i, name in enumerate(("open", "high", "low", "close", "volume"), start=1):
+                arr[name] = table[:, i]
+            return arr
+        except (ValueError, TypeError, IndexError):
+            return candles_to_array(self._normalize_klines(raw))
+
+    def _sanitize_candles(
+        self,
+        candles: List[Dict[str, Any]],
+        timeframe: str,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Dedupe by open_ts (last occurrence wins), order oldest -> newest,
+        keep at most the newest `limit` candles, and report misaligned
+        candles and gaps.
+
+        All timestamp work runs vectorized on one int64 array; the candle
+        dicts are only touched to extract open_ts and to reorder at the end.
+        """
+        n = len(candles)
+        if not n:
             return []
-        normalized = self._normalize_klines(raw)
-        self._check_alignment(normalized, timeframe)
-        # Ensure sorted oldest -> newest
-        normalized.sort(key=lambda x: x["open_ts"])
-        return normalized
-
-    def _check_alignment(self, candles: List[Dict[str, Any]], timeframe: str) -> None:
-        tf_sec = self.app_config.get_timeframe_seconds(timeframe)
-        if not candles:
-            return
-        misaligned = 0
-        for c in candles:
-            if c["open_ts"] % tf_sec != 0:
-                misaligned += 1
-                self.logger.warning(f"[RestClient] Misaligned candle detected: open_ts={c['open_ts']} tf={timeframe}")
-        if misaligned:
-            self.logger.warning(f"[RestClient] Alignment: {misaligned}/{len(candles)} misaligned for {timeframe}")
+        ts = np.fromiter((c["open_ts"] for c in candles), dtype=np.int64, count=n)
+        keep = self._sanitize_ts(ts, timeframe, limit)
+        return [candles[i] for i in keep.tolist()]
+
+    def _sanitize_ts(self, ts: np.ndarray, timeframe: str, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Return the indices into `ts` to keep: one per open_ts (last occurrence),
+        ascending, trimmed to the newest `limit`. Logs misalignment and gaps.
+        """
+        n = ts.size
+        tf_sec = self._tf_seconds(timeframe)
+
+        # Fast path: Binance normally returns aligned, strictly consecutive
+        # candles, which need no dedupe, sort or gap scan.
+        if n and ts[0] % tf_sec == 0 and bool(np.all(np.diff(ts) == tf_sec)):
+            start = n - limit if limit is not None and n > limit else 0
+            return np.arange(start, n)
+
+        # np.unique over the reversed array gives the sorted unique open_ts and,
+        # for each, the index of its *last* occurrence in the original array.
+        unique_ts, rev_idx = np.unique(ts[::-1], return_index=True)
+        keep = (n - 1) - rev_idx
+        if limit is not None and keep.size > limit:
+            unique_ts = unique_ts[-limit:]
+            keep = keep[-limit:]
+
+        # One divmod pass yields both checks: the remainder flags misaligned
+        # candles, the quotient (candle slot index) drives gap detection.
+        slots, rem = np.divmod(unique_ts, tf_sec)
+
+        misaligned = np.flatnonzero(rem)
+        if misaligned.size:
+            self.logger.warning(
+                f"[RestClient] Alignment: {misaligned.size}/{unique_ts.size} misaligned for {timeframe} "
+                f"(first open_ts={int(unique_ts[misaligned[0]])})"
+            )
+
+        missing = np.diff(slots) - 1
+        gaps = int(np.count_nonzero(missing > 0))
+        if gaps:
+            self.logger.warning(
+                f"[RestClient] Gaps: {gaps} gap(s) for {timeframe}, "
+                f"worst={int(missing.max())} missing candle(s)"
+            )
+
+        return keep
 
     def close(self):
         self.session.close()
@@ -415,4 +573,4 @@ class RestClient:
         self.close()
 
 
-__all__ = ["RestClient"]
+__all__ = ["RestClient", "CANDLE_DTYPE", "candles_to_array"]
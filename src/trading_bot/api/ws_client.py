@@ -19,9 +19,17 @@ from typing import Dict, Callable, Optional, Any, List
 
 from websocket import WebSocketApp
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+
 from trading_bot.core.logger import get_logger
 from trading_bot.config.app.models import AppConfig
 
+# Bound once: _on_message stamps every frame with the wall clock
+_time = time.time
+
 
 class WebSocketClient:
     def __init__(self, app_config: AppConfig):
@@ -213,10 +221,10 @@ class WebSocketClient:
 
     def _on_message(self, message: str):
         """Process Binance combined stream messages."""
-        self.last_message_ts = time.time()
+        self.last_message_ts = _time()
 
         try:
-            msg = json.loads(message)
+            msg = _json_loads(message)
 
             # Combined streams always include "stream" & "data"
             if "stream" not in msg or "data" not in msg:
@@ -244,8 +252,8 @@ class WebSocketClient:
             symbol = k.get("s", "UNKNOWN")
             interval = k.get("i", "UNKNOWN")
             self.logger.info(
-                f"[WebSocket] ✓ Received closed candle: {symbol} {interval} "
-                f"(ts={candle['ts']}, close={candle['close']:.8f})"
+                "[WebSocket] ✓ Received closed candle: %s %s (ts=%s, close=%.8f)",
+                symbol, interval, candle["ts"], candle["close"],
             )
 
             cb = self.callbacks.get(stream)
@@ -344,6 +344,13 @@ class TradingBot:
             except Exception:
                 pass
 
+        if self.rest_client:
+            try:
+                self.rest_client.close()
+                self.logger.info("✓ REST session closed")
+            except Exception:
+                pass
+
         if self.duckdb_storage:
             try:
                 self.duckdb_storage.shutdown()
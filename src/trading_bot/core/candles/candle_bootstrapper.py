@@ -15,12 +15,22 @@ making the codebase more maintainable and testable.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
 from trading_bot.core.logger import get_logger
 from trading_bot.validators.candles_validator import CandlesValidator
 
 
 class CandleBootstrapper:
+    # Upper bound on (symbol, timeframe) fetch tasks run concurrently.
+    # RestClient additionally caps requests in flight to respect
+    # Binance's per-IP request weight.
+    MAX_FETCH_WORKERS = 16
+
     def __init__(self, config, storage, rest_client, candle_managers):
         """
         Parameters:
@@ -65,6 +75,11 @@ class CandleBootstrapper:
         """
         Fetch initial historical candles from exchange and store in DuckDB.
         Uses the initial_candles configuration from app.yml.
+
+        Every pending (symbol, timeframe) is fetched as its own task on a
+        worker pool; RestClient caps the number of requests in flight. Each
+        result is handed to the storage writer pool as soon as its fetch
+        completes, so disk writes overlap the remaining downloads.
         
         Returns:
         -------
@@ -73,7 +88,9 @@ class CandleBootstrapper:
         self.logger.info("\n=== Fetching Initial Historical Candles ===")
         
         try:
-            for key, cm in self.cm_map.items():
+            # Collect the (symbol, tf) pairs that still need a REST fetch
+            pending: List[Tuple[str, str]] = []
+            for key in self.cm_map.keys():
                 symbol, tf = key
                 
                 # Check if we already have data for this symbol+timeframe
@@ -86,34 +103,35 @@ class CandleBootstrapper:
                     )
                     continue
                 
-                # Get the number of candles to fetch from config
-                limit = self.config.duckdb.get_initial_candles(tf, default=1000)
-                
-                self.logger.info(f"  → Fetching {limit} candles for {symbol} {tf}...")
-                
-                # Fetch historical candles from exchange
-                candles = self.rest.fetch_klines(symbol, tf, limit=limit)
-                
-                if not candles:
-                    self.logger.warning(f"  ⚠ No candles received for {symbol} {tf}")
-                    continue
+                pending.append(key)
+            
+            if pending:
+                # One reference "now" for every fetch, so all timeframes
+                # page back from the same closed-candle ceiling
+                now = time.time_ns() // 1_000_000_000
+                max_workers = min(self.MAX_FETCH_WORKERS, len(pending))
+                with ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="bootstrap_fetch",
+                ) as pool:
+                    futures = {
+                        pool.submit(self._fetch_initial, symbol, tf, now): (symbol, tf)
+                        for symbol, tf in pending
+                    }
+                    # future.result() re-raises worker failures (handled below)
+                    writes = []
+                    for future in as_completed(futures):
+                        symbol, tf = futures[future]
+                        write = self._store_initial(symbol, tf, future.result())
+                        if write is not None:
+                            writes.append((symbol, tf, write))
                 
-                # Drop last candle (may be incomplete) before storing in database
-                # Database should only contain closed candles
-                if candles:
-                    dropped = candles[-1]
-                    candles = candles[:-1]
+                # DuckDB must hold every batch before validation / memory load
+                for symbol, tf, write in writes:
+                    stored = write.result()
                     self.logger.info(
-                        f"  → Dropped last REST candle {dropped['ts']} "
-                        f"(may be incomplete, WebSocket will provide closed version)"
+                        "  ✓ Fetched and stored %d closed candles for %s %s", stored, symbol, tf
                     )
-                
-                # Save to database (only closed candles)
-                self.storage.bulk_insert_candles(symbol, tf, candles, source="rest")
-                
-                self.logger.info(
-                    f"  ✓ Fetched and stored {len(candles)} closed candles for {symbol} {tf}"
-                )
             
             self.logger.info("\n✓ Initial candles fetch complete")
             
@@ -126,6 +144,43 @@ class CandleBootstrapper:
             self.logger.error(f"[Initial Fetch] Failed: {e}", exc_info=True)
             return False
 
+    def _fetch_initial(self, symbol: str, tf: str, now: Optional[int] = None) -> np.ndarray:
+        """
+        Fetch the configured initial candles for one symbol+timeframe (worker thread).
+        Returned as a structured array: it goes straight to DuckDB, so no
+        per-candle dicts are built.
+        """
+        # Get the number of candles to fetch from config
+        limit = self.config.duckdb.get_initial_candles(tf, default=1000)
+        
+        self.logger.info("  → Fetching %d candles for %s %s...", limit, symbol, tf)
+        
+        # Fetch historical candles from exchange
+        return self.rest.fetch_klines_array(symbol, tf, limit=limit, now=now)
+
+    def _store_initial(self, symbol: str, tf: str, candles: np.ndarray) -> Optional[Future]:
+        """
+        Queue fetched initial candles for persistence (calling thread).
+        Returns the storage write future, or None if nothing was fetched.
+        """
+        if len(candles) == 0:
+            self.logger.warning("  ⚠ No candles received for %s %s", symbol, tf)
+            return None
+        
+        # Drop last candle (may be incomplete) before storing in database
+        # Database should only contain closed candles
+        dropped = candles[-1]
+        candles = candles[:-1]
+        self.logger.info(
+            "  → Dropped last REST candle %d "
+            "(may be incomplete, WebSocket will provide closed version)",
+            dropped["open_ts"],
+        )
+        
+        # Save to database (only closed candles) on the storage writer pool,
+        # so the disk write overlaps the fetches still in flight
+        return self.storage.bulk_insert_candles_async(symbol, tf, candles, source="rest")
+
     # -------------------------------------------------------------
     # Validate fetched data - COMPREHENSIVE CHECK
     # -------------------------------------------------------------
@@ -242,28 +297,42 @@ class CandleBootstrapper:
         Loads all candles from DuckDB into CandleManager memory.
 
         Handles the critical "drop last candle" logic in incremental mode.
+
+        The DuckDB read for the next (symbol, timeframe) is prefetched on a
+        single worker while the current window is seeded into its CandleManager.
         """
         self.logger.info("\n=== Loading Sliding Windows into Memory ===")
 
         try:
-            for key, cm in self.cm_map.items():
+            items = list(self.cm_map.items())
+
+            # Load exactly the configured amount from database
+            # Database only contains closed candles (last one was dropped before storing)
+            def _load(key, cm):
                 symbol, tf = key
-                
-                # Load exactly the configured amount from database
-                # Database only contains closed candles (last one was dropped before storing)
-                limit = cm._candles.maxlen
-                candles = self.storage.load(symbol, tf, limit=limit)
+                return self.storage.load(symbol, tf, limit=cm._candles.maxlen)
 
-                cm.load_from_list(candles)
-                
-                # Get actual count in memory
-                actual_loaded = cm.size()
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bootstrap_load") as loader:
+                future = loader.submit(_load, *items[0]) if items else None
+
+                for i, (key, cm) in enumerate(items):
+                    symbol, tf = key
+                    candles = future.result()
+
+                    # Start the next read before seeding this window
+                    if i + 1 < len(items):
+                        future = loader.submit(_load, *items[i + 1])
+
+                    cm.load_from_list(candles)
                 
-                # Log loaded count (should match config, no truncation)
-                self.logger.info(
-                    f"  ✓ Loaded {actual_loaded} candles into memory for {symbol} {tf} "
-                    f"(config limit: {cm._candles.maxlen})"
-                )
+                    # Get actual count in memory
+                    actual_loaded = cm.size()
+                    
+                    # Log loaded count (should match config, no truncation)
+                    self.logger.info(
+                        "  ✓ Loaded %d candles into memory for %s %s (config limit: %s)",
+                        actual_loaded, symbol, tf, cm._candles.maxlen,
+                    )
 
             self.logger.info("\n✓ All candles loaded into memory successfully")
             return True
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Deque, List, Dict, Any, Optional
+from itertools import islice
+from typing import Deque, List, Dict, Any, Optional, Tuple
 
 Candle = Dict[str, Any]
 
@@ -24,6 +25,7 @@ class CandleManager:
         self.tf = tf
         self._candles: Deque[Candle] = deque(maxlen=maxlen)
         self._tf_sec: Optional[int] = None  # set later via setter
+        self._snapshot: Optional[Tuple[Candle, ...]] = None  # cached get_all()
 
     # ------------------------------------------------------------------
     # SETUP
@@ -48,8 +50,14 @@ class CandleManager:
     def size(self) -> int:
         return len(self._candles)
 
-    def get_all(self) -> List[Candle]:
-        return list(self._candles)
+    def get_all(self) -> Tuple[Candle, ...]:
+        """
+        Return the window as an immutable tuple (oldest -> newest).
+        The tuple is built once and reused until the window changes.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._candles)
+        return self._snapshot
 
     # ------------------------------------------------------------------
     # LOAD INITIAL LIST
@@ -58,8 +66,15 @@ class CandleManager:
         """
         Load an entire list (used on startup from DuckDB).
         Ensures strict timestamp ordering.
+        Only the newest `maxlen` candles are kept; older ones are skipped
+        rather than appended and immediately evicted by the deque.
         """
         self._candles.clear()
+        self._snapshot = None
+
+        maxlen = self._candles.maxlen
+        if maxlen is not None and len(candles) > maxlen:
+            candles = islice(candles, len(candles) - maxlen, None)
 
         last_ts = None
         for c in candles:
@@ -82,6 +97,7 @@ class CandleManager:
         """
         ts = c["ts"]
         last_ts = self.last_ts()
+        self._snapshot = None
 
         # First ever candle
         if last_ts is None:
@@ -116,6 +132,7 @@ class CandleManager:
             )
 
         self._candles[-1] = c
+        self._snapshot = None
 
     # ------------------------------------------------------------------
     # DROP UNTIL
@@ -127,6 +144,7 @@ class CandleManager:
         """
         while self._candles and self._candles[-1]["ts"] >= target_ts:
             self._candles.pop()
+            self._snapshot = None
 
     # ------------------------------------------------------------------
     # GAP DETECTION
@@ -1,9 +1,14 @@
 from __future__ import annotations
+import logging
+from operator import itemgetter
 from typing import Optional, Dict, Any, Callable, List
 
 from trading_bot.core.logger import get_logger
 from trading_bot.config.app.models import AppConfig
 
+# C-implemented sort key (cheaper than a per-call lambda)
+_BY_TS = itemgetter("ts")
+
 
 class CandleSync:
     """
@@ -61,10 +66,10 @@ class CandleSync:
             c = raw  # Use already-normalized data from WebSocket
 
         # Debug: Log incoming timestamps for 1h timeframe
-        if self.tf == "1h":
+        if self.tf == "1h" and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"[CandleSync] {self.symbol} {self.tf} received WS candle: "
-                f"ts={c['ts']}, open_ts={c.get('open_ts')}, close_ts={c.get('close_ts')}"
+                "[CandleSync] %s %s received WS candle: ts=%s, open_ts=%s, close_ts=%s",
+                self.symbol, self.tf, c["ts"], c.get("open_ts"), c.get("close_ts"),
             )
 
         last_ts = self.cm.last_ts()
@@ -121,7 +126,9 @@ class CandleSync:
             self.logger.warning(f"[CandleSync] No missing candles found for reverse recovery")
             return
 
-        missing.sort(key=lambda x: x["ts"])
+        # RestClient already returns candles deduped and ordered; this sort is a
+        # cheap O(n) safety net on sorted input.
+        missing.sort(key=_BY_TS)
 
         for c in missing:
             # ------------------------------------------------------
@@ -8,88 +8,407 @@ Behavior:
 - Log level is taken from the environment variable `LOG_LEVEL` (default INFO).
 - Creates daily log files in `logs/` directory.
 - Automatically rotates at midnight (creates new file, archives old one).
-- Archives old logs to `logs/archive/YYYY-MM-DD/` on rotation.
+- Archives old logs to `logs/archive/YYYY-MM-DD/` on rotation and at startup.
 - Deletes logs older than 7 days from archive.
+- File writes are buffered (`LOG_BUFFER_BYTES`, default 64 KB) and written
+  when the buffer fills, every `LOG_FLUSH_INTERVAL` seconds (default 30), on
+  ERROR and above, and on shutdown.
 """
+import atexit
 import logging
 import logging.handlers
 import os
 import shutil
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Set, Union
 
 
-class DailyRotatingFileHandler(logging.Handler):
-	"""Custom handler that rotates log files at midnight and archives old files."""
+class _CachedTimeFormatter(logging.Formatter):
+	"""Formatter that renders `%(asctime)s` once per wall-clock second.
+	
+	Only used with a second-resolution `datefmt`, so every record created
+	within the same second gets the same string. The formatted line is also
+	kept on the record, so handlers sharing this formatter format it once.
+	"""
+	
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		# (second, formatted) kept in one tuple so threads swap it atomically
+		self._cached_time = (-1, "")
+	
+	def formatTime(self, record, datefmt=None):
+		if datefmt is None:
+			# Default format includes milliseconds; nothing to cache
+			return super().formatTime(record, datefmt)
+		sec = int(record.created)
+		cached_sec, cached_str = self._cached_time
+		if sec == cached_sec:
+			return cached_str
+		formatted = super().formatTime(record, datefmt)
+		self._cached_time = (sec, formatted)
+		return formatted
+	
+	def format(self, record):
+		cached = record.__dict__.get("_formatted")
+		if cached is not None and cached[0] is self:
+			return cached[1]
+		line = super().format(record)
+		record._formatted = (self, line)
+		return line
+
+
+# One formatter shared by every console and file handler
+_SHARED_FORMATTER = _CachedTimeFormatter(
+	"%(asctime)s %(levelname)-8s [%(name)s] %(message)s",
+	datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+# Handlers flushed periodically by the background flush thread (add, discard
+# and snapshot under _flush_lock: handlers are created lazily on any thread)
+_FLUSH_HANDLERS: "weakref.WeakSet[logging.Handler]" = weakref.WeakSet()
+_flush_thread: Optional[threading.Thread] = None
+_flush_lock = threading.RLock()  # reentrant: close() may run from a finalizer
+
+# Current local date shared by every DailyRotatingFileHandler. One clock
+# thread advances it at midnight, so emit() reads no clock of its own.
+_ROTATION_TICK: Dict[str, str] = {"date": datetime.now().strftime("%Y-%m-%d")}
+_clock_thread: Optional[threading.Thread] = None
+
+# Archiving and retention cleanup run here so the record that crosses
+# midnight only pays for reopening the log file
+_ROTATION_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotation")
+
+# Directories already created (or found to exist) by this process
+_KNOWN_DIRS: Set[str] = set()
+
+
+def _flush_loop(interval: float) -> None:
+	while True:
+		time.sleep(interval)
+		with _flush_lock:
+			handlers = list(_FLUSH_HANDLERS)
+		for handler in handlers:
+			# One failing handler (e.g. ENOSPC) must not stop the thread for the rest
+			try:
+				handler.flush()
+				# MemoryHandler.flush() only moves records into its (buffering)
+				# target; write them out in this same pass
+				target = getattr(handler, "target", None)
+				if target is not None:
+					target.flush()
+			except Exception as e:
+				print(f"[Logger] Warning: Periodic flush failed for {handler!r}: {e}")
+
+
+def _next_midnight_ts() -> float:
+	"""Return the epoch timestamp of the next local midnight."""
+	tomorrow = (datetime.now() + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+	return tomorrow.timestamp()
+
+
+def _clock_loop() -> None:
+	while True:
+		# Wake at midnight; cap the sleep so wall-clock adjustments are picked up
+		time.sleep(min(max(_next_midnight_ts() - time.time(), 0.0), 60.0))
+		_advance_rotation_date()
+
+
+def _advance_rotation_date() -> None:
+	"""Move the shared date to today; never backwards.
+	
+	Both writers (clock thread, new handlers) go through here under
+	_flush_lock, so a stale read by one cannot undo the other's update.
+	"""
+	today = datetime.now().strftime("%Y-%m-%d")
+	with _flush_lock:
+		# YYYY-MM-DD strings order like the dates
+		if today > _ROTATION_TICK["date"]:
+			_ROTATION_TICK["date"] = today
+
+
+def _start_clock_thread() -> None:
+	"""Refresh the shared date and start the rotation clock thread once.
+	
+	The date is re-read on every call: the module may have been imported on
+	an earlier day than the first handler is created (handlers are lazy).
+	"""
+	global _clock_thread
+	_advance_rotation_date()
+	with _flush_lock:
+		if _clock_thread is None:
+			_clock_thread = threading.Thread(target=_clock_loop, name="log-clock", daemon=True)
+			_clock_thread.start()
+
+
+def _register_for_flush(handler: logging.Handler, interval: float) -> None:
+	"""Add `handler` to the periodic flush set, starting the flush thread once."""
+	global _flush_thread
+	with _flush_lock:
+		_FLUSH_HANDLERS.add(handler)
+		if _flush_thread is None:
+			_flush_thread = threading.Thread(
+				target=_flush_loop, args=(interval,), name="log-flush", daemon=True
+			)
+			_flush_thread.start()
+
+
+class DailyRotatingFileHandler(logging.StreamHandler):
+	"""Custom handler that rotates log files at midnight and archives old files.
+	
+	Encoded records collect in an in-memory buffer that is written to an
+	O_APPEND file descriptor with os.write once it reaches LOG_BUFFER_BYTES,
+	and on flush() (periodic thread, ERROR records, rotation and shutdown).
+	"""
+	
+	# Append-only, not inherited by child processes
+	_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
 	
 	def __init__(self, logs_dir: str, retention_days: int = 7, prefix: str = "app"):
 		super().__init__()
+		self.stream = None  # unused: records go to self._fd (StreamHandler defaults to stderr)
+		self._fd: Optional[int] = None
+		self._buf = bytearray()
 		self.logs_dir = Path(logs_dir)
 		self.retention_days = retention_days
 		self.prefix = prefix  # e.g., "app", "BTCUSDT", "XRPUSDT"
-		self.current_date = datetime.now().strftime("%Y-%m-%d")
-		self.current_handler = None
+		# Paths are plain str templates: no Path objects built per rotation
+		self._path_template = os.path.join(str(self.logs_dir), prefix + "_{}.log")
+		self._archive_template = os.path.join(str(self.logs_dir), "archive", "{}")
+		self.buffer_bytes = int(os.getenv("LOG_BUFFER_BYTES", "65536"))
+		self.flush_interval = _resolve_flush_interval()
+		_start_clock_thread()
+		self.current_date = _ROTATION_TICK["date"]
+		self._startup_sweep()
 		self._setup_handler()
+		_register_for_flush(self, self.flush_interval)
 	
-	def _setup_handler(self):
-		"""Create or recreate the file handler for current date."""
-		# Close existing handler if any
-		if self.current_handler:
-			self.current_handler.close()
+	def _startup_sweep(self):
+		"""Archive this prefix's log files from earlier days; delete those already past retention.
 		
-		# Create log file for current date with prefix
-		log_file = self.logs_dir / f"{self.prefix}_{self.current_date}.log"
-		self.current_handler = logging.FileHandler(str(log_file), encoding="utf-8")
+		One scandir pass over the logs directory, run once when the handler is created.
+		"""
+		try:
+			prefix = self.prefix + "_"
+			today_int = int(self.current_date.replace("-", ""))
+			cutoff_int = int((datetime.now() - timedelta(days=self.retention_days)).strftime("%Y%m%d"))
+			moved = deleted = 0
+			
+			with os.scandir(self.logs_dir) as it:
+				for entry in it:
+					# PREFIX_YYYY-MM-DD.log
+					name = entry.name
+					if not (name.startswith(prefix) and name.endswith(".log")):
+						continue
+					file_date = name[len(prefix):-4]
+					try:
+						file_int = int(file_date.replace("-", ""))
+					except ValueError:
+						continue
+					if file_int >= today_int or not entry.is_file(follow_symlinks=False):
+						continue
+					
+					if file_int < cutoff_int:
+						# Would be archived only to be deleted by retention cleanup
+						os.remove(entry.path)
+						deleted += 1
+					else:
+						archive_dir = self._archive_template.format(file_date)
+						_ensure_dir(archive_dir)
+						_move_file(entry.path, os.path.join(archive_dir, name))
+						moved += 1
+			
+			if moved or deleted:
+				print(f"[Logger] Startup sweep ({self.prefix}): archived {moved}, deleted {deleted} old log files")
+		except Exception as e:
+			print(f"[Logger] Warning: Failed to sweep old {self.prefix} logs: {e}")
+	
+	def _setup_handler(self):
+		"""Open (or reopen) the log file for the current date."""
+		# Close existing file if any, writing out pending records first
+		if self._fd is not None:
+			self._write_buffer()
+			os.close(self._fd)
 		
-		# Copy formatter from parent handler
-		if self.formatter:
-			self.current_handler.setFormatter(self.formatter)
+		log_file = self._path_template.format(self.current_date)
+		self._fd = os.open(log_file, self._OPEN_FLAGS, 0o644)
+	
+	def _write_buffer(self):
+		"""Write the buffered bytes to the file descriptor (caller holds the lock)."""
+		_write_all(self._fd, self._buf)
+		self._buf.clear()
 	
 	def emit(self, record):
 		"""Emit a record, rotating the file if date has changed."""
 		try:
-			# Check if date has changed (midnight rollover)
-			current_date = datetime.now().strftime("%Y-%m-%d")
+			data = (self.format(record) + self.terminator).encode("utf-8")
 			
-			if current_date != self.current_date:
-				# Archive the old log file
-				old_date = self.current_date
-				old_log_file = self.logs_dir / f"{self.prefix}_{old_date}.log"
-				
-				# Close current handler before archiving
-				if self.current_handler:
-					self.current_handler.close()
-				
-				# Archive old file
-				if old_log_file.exists():
-					archive_dir = self.logs_dir / "archive" / old_date
-					archive_dir.mkdir(parents=True, exist_ok=True)
-					shutil.move(str(old_log_file), str(archive_dir / old_log_file.name))
-					# Using print here as logger may not be fully initialized during rotation
-					print(f"[Logger] Rotated log: archived {old_log_file.name} to archive/{old_date}/")
-				
-				# Cleanup old archives
-				_cleanup_old_archive_logs(self.logs_dir, self.retention_days)
-				
-				# Update current date and setup new handler
-				self.current_date = current_date
-				self._setup_handler()
+			if self._fd is None:
+				# Already closed (logging.shutdown can close this handler before a
+				# MemoryHandler forwards its last records): append straight to the
+				# file instead of buffering bytes nothing will write
+				fd = os.open(self._path_template.format(self.current_date), self._OPEN_FLAGS, 0o644)
+				try:
+					_write_all(fd, data)
+				finally:
+					os.close(fd)
+				return
+			
+			# Check for midnight rollover against the shared clock thread's date
+			if _ROTATION_TICK["date"] != self.current_date:
+				self._rollover()
 			
-			# Emit the record to current handler
-			if self.current_handler:
-				self.current_handler.emit(record)
+			# Encode once into the buffer; write only when it is full
+			self._buf += data
+			# Errors must reach disk immediately
+			if len(self._buf) >= self.buffer_bytes or record.levelno >= logging.ERROR:
+				self._write_buffer()
 				
+		except RecursionError:
+			raise
 		except Exception:
 			self.handleError(record)
 	
+	def _rollover(self):
+		"""Archive the previous day's file and open the file for the new date."""
+		current_date = _ROTATION_TICK["date"]
+		old_date = self.current_date
+		old_log_file = self._path_template.format(old_date)
+		
+		# Switch to the new date's file (pending records go to the old one) ...
+		self.current_date = current_date
+		self._setup_handler()
+		
+		# ... and archive the old file + cleanup old archives in the background
+		_ROTATION_POOL.submit(
+			_do_rotation,
+			old_log_file,
+			self._archive_template.format(old_date),
+			self.logs_dir,
+			self.retention_days,
+		)
+	
+	def flush(self):
+		"""Write buffered records to the file."""
+		self.acquire()
+		try:
+			if self._fd is not None and self._buf:
+				self._write_buffer()
+		finally:
+			self.release()
+	
 	def close(self):
-		"""Close the handler."""
-		if self.current_handler:
-			self.current_handler.close()
+		"""Flush and close the log file."""
+		with _flush_lock:
+			_FLUSH_HANDLERS.discard(self)
+		self.acquire()
+		try:
+			try:
+				if self._fd is not None:
+					try:
+						self.flush()
+					finally:
+						fd = self._fd
+						self._fd = None
+						os.close(fd)
+			finally:
+				super().close()
+		finally:
+			self.release()
+
+
+class _LazyFileHandler(logging.Handler):
+	"""Creates its real file handler on the first record that reaches it.
+	
+	Until then no logs directory, file, archive sweep or flush thread is set
+	up, so a process that never logs at the configured level (e.g.
+	LOG_LEVEL=WARNING) pays no file I/O setup at all.
+	"""
+	
+	def __init__(self, factory: Callable[[], logging.Handler]):
+		super().__init__()
+		self._factory = factory
+		self._target: Optional[logging.Handler] = None
+		self._failed = False
+	
+	def emit(self, record):
+		# handle() holds self.lock here, so the target is created only once
+		target = self._target
+		if target is None:
+			if self._failed:
+				return
+			try:
+				target = self._target = self._factory()
+			except Exception as e:
+				# If the file handler can't be created, stay console only
+				self._failed = True
+				print(f"[Logger] Warning: Failed to create file handler: {e}")
+				return
+			# MemoryHandler.close() drops its target, which would garbage-collect
+			# the file handler with records still in its buffer: close it (writing
+			# them out) when this wrapper goes away. Closing twice is harmless.
+			weakref.finalize(self, target.close).atexit = False
+		target.handle(record)
+	
+	def flush(self):
+		if self._target:
+			self._target.flush()
+	
+	def close(self):
+		if self._target:
+			self._target.close()
 		super().close()
 
 
+def _write_all(fd: int, data: Union[bytes, bytearray]) -> None:
+	"""os.write `data` to `fd` in full, resuming after partial writes."""
+	view = memoryview(data)
+	try:
+		while view:
+			view = view[os.write(fd, view):]
+	finally:
+		view.release()
+
+
+def _move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+	"""Rename `src` to `dst` (one syscall); fall back to a copying move across filesystems."""
+	try:
+		os.replace(src, dst)
+	except OSError:
+		shutil.move(str(src), str(dst))
+
+
+def _do_rotation(old_log_file: str, archive_dir: str, logs_dir: Path, retention_days: int) -> None:
+	"""Archive a rotated-out log file and apply archive retention (rotation pool)."""
+	name = os.path.basename(old_log_file)
+	try:
+		if os.path.exists(old_log_file):
+			_ensure_dir(archive_dir)
+			_move_file(old_log_file, os.path.join(archive_dir, name))
+			# Using print here as logger may not be fully initialized during rotation
+			print(f"[Logger] Rotated log: archived {name} to archive/{os.path.basename(archive_dir)}/")
+	except Exception as e:
+		print(f"[Logger] Warning: Failed to archive {name}: {e}")
+	
+	# Cleanup old archives
+	_cleanup_old_archive_logs(logs_dir, retention_days)
+
+
+def _ensure_dir(path: Union[str, Path]) -> None:
+	"""mkdir -p `path`, skipping the syscalls for directories already seen."""
+	path = os.fspath(path)
+	if path in _KNOWN_DIRS:
+		return
+	os.makedirs(path, exist_ok=True)
+	_KNOWN_DIRS.add(path)
+
+
 def _ensure_logs_dir(path: str) -> None:
 	try:
 		os.makedirs(path, exist_ok=True)
@@ -99,32 +418,12 @@ def _ensure_logs_dir(path: str) -> None:
 		pass
 
 
-def _archive_old_logs(logs_dir: Path, today: str) -> None:
-	"""Move old log files (not today) to archive directory."""
-	try:
-		archive_dir = logs_dir / "archive"
-		moved_count = 0
-		
-		for log_file in logs_dir.glob("app_*.log"):
-			# Extract date from filename (app_YYYY-MM-DD.log)
-			filename = log_file.name
-			if filename.startswith("app_") and filename.endswith(".log"):
-				file_date = filename[4:-4]  # Extract YYYY-MM-DD
-				
-				if file_date != today:
-					# Create date subdirectory in archive
-					date_archive_dir = archive_dir / file_date
-					date_archive_dir.mkdir(parents=True, exist_ok=True)
-					
-					# Move file to archive
-					dest_path = date_archive_dir / log_file.name
-					shutil.move(str(log_file), str(dest_path))
-					moved_count += 1
-		
-		if moved_count > 0:
-			print(f"[Logger] Archived {moved_count} old log files")
-	except Exception as e:
-		print(f"[Logger] Warning: Failed to archive logs: {e}")
+def _bulk_rmtree(paths: List[str], retention_days: int) -> None:
+	"""Delete expired archive day-directories (rotation pool)."""
+	for path in paths:
+		shutil.rmtree(path, ignore_errors=True)
+		_KNOWN_DIRS.discard(path)
+	print(f"[Logger] Cleaned up {len(paths)} archive log directories older than {retention_days} days")
 
 
 def _cleanup_old_archive_logs(logs_dir: Path, retention_days: Optional[int] = None) -> None:
@@ -134,24 +433,32 @@ def _cleanup_old_archive_logs(logs_dir: Path, retention_days: Optional[int] = No
 			retention_days = int(os.getenv("LOG_RETENTION_DAYS", "7"))
 		
 		archive_dir = logs_dir / "archive"
-		if not archive_dir.exists():
-			return
 		
+		# Dates compared as YYYYMMDD integers
 		cutoff_date = datetime.now() - timedelta(days=retention_days)
-		cutoff_str = cutoff_date.strftime("%Y-%m-%d")
+		cutoff_int = int(cutoff_date.strftime("%Y%m%d"))
 		
-		deleted_dirs = 0
-		for date_dir in archive_dir.iterdir():
-			if not date_dir.is_dir():
-				continue
-			
-			dir_date = date_dir.name
-			if dir_date < cutoff_str:
-				shutil.rmtree(date_dir)
-				deleted_dirs += 1
+		expired = []
+		try:
+			it = os.scandir(archive_dir)
+		except FileNotFoundError:
+			return
+		with it:
+			for entry in it:
+				if not entry.is_dir(follow_symlinks=False):
+					continue
+				
+				try:
+					dir_int = int(entry.name.replace("-", ""))
+				except ValueError:
+					continue  # not a YYYY-MM-DD archive directory
+				
+				if dir_int < cutoff_int:
+					expired.append(entry.path)
 		
-		if deleted_dirs > 0:
-			print(f"[Logger] Cleaned up {deleted_dirs} archive log directories older than {retention_days} days")
+		# Deleting can take a while (many days after downtime); don't block the caller
+		if expired:
+			_ROTATION_POOL.submit(_bulk_rmtree, expired, retention_days)
 	except Exception as e:
 		print(f"[Logger] Warning: Failed to cleanup archive logs: {e}")
 
@@ -166,34 +473,51 @@ def _configure_root_logger(log_level: int, logs_dir: Optional[str]) -> None:
 
 	# Console handler
 	console_h = logging.StreamHandler()
-	console_fmt = logging.Formatter(
-		"%(asctime)s %(levelname)-8s [%(name)s] %(message)s",
-		datefmt="%Y-%m-%d %H:%M:%S",
-	)
-	console_h.setFormatter(console_fmt)
+	console_h.setFormatter(_SHARED_FORMATTER)
 	root.addHandler(console_h)
 
-	# File handler (date-based with automatic midnight rotation)
+	# File handler (date-based with automatic midnight rotation), created on
+	# the first record that reaches it
 	if logs_dir:
-		_ensure_logs_dir(logs_dir)
-		try:
-			# Archive old logs and cleanup on startup
-			today = datetime.now().strftime("%Y-%m-%d")
-			base_dir = Path(logs_dir)
-			_archive_old_logs(base_dir, today)
-			_cleanup_old_archive_logs(base_dir, retention_days=7)
+		def _open_file_handler() -> logging.Handler:
+			_ensure_logs_dir(logs_dir)
+			
+			# Cleanup old archives on startup (the handler sweeps old app_*.log files)
+			_cleanup_old_archive_logs(Path(logs_dir), retention_days=7)
 			
 			# Create custom rotating file handler
 			file_h = DailyRotatingFileHandler(logs_dir, retention_days=7)
-			file_fmt = logging.Formatter(
-				"%(asctime)s %(levelname)-8s [%(name)s] %(message)s",
-				datefmt="%Y-%m-%d %H:%M:%S",
-			)
-			file_h.setFormatter(file_fmt)
-			root.addHandler(file_h)
-		except Exception:
-			# If file handler can't be created, fall back to console only.
-			pass
+			file_h.setFormatter(_SHARED_FORMATTER)
+			return file_h
+		
+		root.addHandler(_LazyFileHandler(_open_file_handler))
+
+
+@lru_cache(maxsize=1)
+def _resolve_level() -> int:
+	"""Log level from `LOG_LEVEL` (default INFO); read once per process."""
+	level_name = os.getenv("LOG_LEVEL", "INFO").upper()
+	try:
+		return getattr(logging, level_name)
+	except AttributeError:
+		return logging.INFO
+
+
+@lru_cache(maxsize=1)
+def _resolve_flush_interval() -> float:
+	"""Seconds between periodic flushes from `LOG_FLUSH_INTERVAL` (default 30); read once."""
+	return float(os.getenv("LOG_FLUSH_INTERVAL", "30"))
+
+
+@lru_cache(maxsize=1)
+def _resolve_logs_dir() -> str:
+	"""Logs directory from `LOGS_DIR`, else `<project root>/logs`; resolved once per process."""
+	logs_dir = os.getenv("LOGS_DIR")
+	if not logs_dir:
+		# Go up from src/trading_bot/core/logger.py to project root
+		project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+		logs_dir = os.path.join(project_root, "logs")
+	return logs_dir
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -206,23 +530,38 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
 
 	The top-level configuration runs once on the first call.
 	"""
-	# Read configuration from environment; defaults are safe for production.
-	level_name = os.getenv("LOG_LEVEL", "INFO").upper()
-	try:
-		level = getattr(logging, level_name)
-	except AttributeError:
-		level = logging.INFO
+	# Configuration comes from the environment (read once); defaults are safe for production.
+	_configure_root_logger(_resolve_level(), _resolve_logs_dir())
 
-	# Get logs directory from environment or use default
-	logs_dir = os.getenv("LOGS_DIR")
-	if not logs_dir:
-		# Go up from src/trading_bot/core/logger.py to project root
-		project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-		logs_dir = os.path.join(project_root, "logs")
+	return logging.getLogger(name if name else "trading-bot")
 
-	_configure_root_logger(level, logs_dir)
 
-	return logging.getLogger(name if name else "trading-bot")
+# Records a symbol logger buffers in memory before writing them to its file
+_SYMBOL_BUFFER_RECORDS = 256
+
+# Symbol loggers already built by get_symbol_logger; membership here is what
+# keeps handlers from being added twice
+_SYMBOL_LOGGERS: Dict[str, logging.Logger] = {}
+_SYMBOL_LOGGERS_LOCK = threading.Lock()
+
+
+def _flush_symbol_handlers() -> None:
+	"""Push records buffered in symbol MemoryHandlers into their file handlers.
+	
+	Registered with atexit after the logging module's own hook, so it runs
+	before logging.shutdown, which closes each symbol's file handler before
+	the MemoryHandler in front of it.
+	"""
+	for logger in list(_SYMBOL_LOGGERS.values()):
+		for handler in logger.handlers:
+			if isinstance(handler, logging.handlers.MemoryHandler):
+				try:
+					handler.flush()
+				except Exception as e:
+					print(f"[Logger] Warning: Failed to flush {logger.name} on exit: {e}")
+
+
+atexit.register(_flush_symbol_handlers)
 
 
 def get_symbol_logger(symbol: str) -> logging.Logger:
@@ -243,19 +582,23 @@ def get_symbol_logger(symbol: str) -> logging.Logger:
 	Returns:
 		Configured logger instance with symbol-specific file handler
 	"""
-	# Read configuration from environment
-	level_name = os.getenv("LOG_LEVEL", "INFO").upper()
-	try:
-		level = getattr(logging, level_name)
-	except AttributeError:
-		level = logging.INFO
+	# Fast path: already built for this symbol
+	cached = _SYMBOL_LOGGERS.get(symbol)
+	if cached is not None:
+		return cached
 	
-	# Get logs directory from environment or use default
-	logs_dir = os.getenv("LOGS_DIR")
-	if not logs_dir:
-		project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-		logs_dir = os.path.join(project_root, "logs")
-	_ensure_logs_dir(logs_dir)
+	with _SYMBOL_LOGGERS_LOCK:
+		cached = _SYMBOL_LOGGERS.get(symbol)
+		if cached is None:
+			cached = _SYMBOL_LOGGERS[symbol] = _build_symbol_logger(symbol)
+		return cached
+
+
+def _build_symbol_logger(symbol: str) -> logging.Logger:
+	"""Create and configure the `trading-bot.<symbol>` logger (first call per symbol)."""
+	# Configuration comes from the environment (read once)
+	level = _resolve_level()
+	logs_dir = _resolve_logs_dir()
 	
 	# Create logger with symbol-specific name
 	logger_name = f"trading-bot.{symbol}"
@@ -265,31 +608,30 @@ def get_symbol_logger(symbol: str) -> logging.Logger:
 	logger.propagate = False
 	logger.setLevel(level)
 	
-	# Check if already configured (avoid duplicate handlers)
-	if logger.handlers:
-		return logger
-	
 	# Add console handler (shared output)
 	console_h = logging.StreamHandler()
-	console_fmt = logging.Formatter(
-		"%(asctime)s %(levelname)-8s [%(name)s] %(message)s",
-		datefmt="%Y-%m-%d %H:%M:%S",
-	)
-	console_h.setFormatter(console_fmt)
+	console_h.setFormatter(_SHARED_FORMATTER)
 	logger.addHandler(console_h)
 	
-	# Add symbol-specific file handler with daily rotation
-	try:
+	# Add symbol-specific file handler with daily rotation (created on first
+	# use), fronted by a MemoryHandler so tick bursts reach the file in batches.
+	# ERROR and above flush immediately; the periodic flush thread and
+	# shutdown drain the rest.
+	def _open_file_handler() -> logging.Handler:
+		_ensure_logs_dir(logs_dir)
 		retention_days = int(os.getenv("LOG_RETENTION_DAYS", "7"))
 		file_h = DailyRotatingFileHandler(logs_dir, retention_days=retention_days, prefix=symbol)
-		file_fmt = logging.Formatter(
-			"%(asctime)s %(levelname)-8s %(message)s",
-			datefmt="%Y-%m-%d %H:%M:%S",
-		)
-		file_h.setFormatter(file_fmt)
-		logger.addHandler(file_h)
-	except Exception as e:
-		print(f"[Logger] Warning: Failed to create file handler for {symbol}: {e}")
+		file_h.setFormatter(_SHARED_FORMATTER)
+		return file_h
+	
+	mem_h = logging.handlers.MemoryHandler(
+		capacity=_SYMBOL_BUFFER_RECORDS,
+		flushLevel=logging.ERROR,
+		target=_LazyFileHandler(_open_file_handler),
+		flushOnClose=True,
+	)
+	_register_for_flush(mem_h, _resolve_flush_interval())
+	logger.addHandler(mem_h)
 	
 	return logger
 
@@ -13,9 +13,10 @@ import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from threading import Lock
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import duckdb
+import numpy as np
 import pandas as pd
 
 from trading_bot.core.logger import get_logger
@@ -163,10 +164,9 @@ class DuckDBStorage:
                 query += f" LIMIT {limit}"
             
             rows = self.conn.execute(query, [symbol, timeframe]).fetchall()
-            
-            # Reverse to get ascending order (oldest first)
-            rows = list(reversed(rows))
 
+            # Iterate in reverse to get ascending order (oldest first) without
+            # materializing a reversed copy of the row list
             return [
                 {
                     "symbol": r[0],
@@ -181,7 +181,7 @@ class DuckDBStorage:
                     "volume": r[8],
                     "is_closed": bool(r[9]),
                 }
-                for r in rows
+                for r in reversed(rows)
             ]
 
         except Exception as e:
@@ -235,28 +235,50 @@ class DuckDBStorage:
     # Bulk insert (WRITE - locked for safety)
     # ------------------------------------------------------------------
     def bulk_insert_candles(self, symbol: str, timeframe: str, candles, source="rest"):
-        if not candles:
+        """
+        `candles` is either a list of candle dicts or a CANDLE_DTYPE
+        structured array (RestClient.fetch_klines_array); arrays are turned
+        into the insert DataFrame column-wise without per-row conversion.
+        """
+        if candles is None or len(candles) == 0:
             return 0
 
         try:
-            df = pd.DataFrame(
-                [
+            if isinstance(candles, np.ndarray):
+                df = pd.DataFrame(
                     {
                         "symbol": symbol,
                         "timeframe": timeframe,
-                        "open_ts": int(c.get("open_ts", c["ts"])),
-                        "close_ts": int(c.get("close_ts", c.get("open_ts", c["ts"]))),
-                        "open": float(c["open"]),
-                        "high": float(c["high"]),
-                        "low": float(c["low"]),
-                        "close": float(c["close"]),
-                        "volume": float(c["volume"]),
-                        "is_closed": bool(c.get("closed", True)),
+                        "open_ts": candles["open_ts"],
+                        "close_ts": candles["close_ts"],
+                        "open": candles["open"],
+                        "high": candles["high"],
+                        "low": candles["low"],
+                        "close": candles["close"],
+                        "volume": candles["volume"],
+                        "is_closed": True,
                         "source": source,
                     }
-                    for c in candles
-                ]
-            )
+                )
+            else:
+                df = pd.DataFrame(
+                    [
+                        {
+                            "symbol": symbol,
+                            "timeframe": timeframe,
+                            "open_ts": int(c.get("open_ts", c["ts"])),
+                            "close_ts": int(c.get("close_ts", c.get("open_ts", c["ts"]))),
+                            "open": float(c["open"]),
+                            "high": float(c["high"]),
+                            "low": float(c["low"]),
+                            "close": float(c["close"]),
+                            "volume": float(c["volume"]),
+                            "is_closed": bool(c.get("closed", True)),
+                            "source": source,
+                        }
+                        for c in candles
+                    ]
+                )
 
             with self.write_lock:
                 self.conn.register("tmp_df", df)
@@ -281,6 +303,10 @@ class DuckDBStorage:
             self.logger.error(f"[DuckDBStorage] bulk_insert_candles: {e}")
             return 0
 
+    def bulk_insert_candles_async(self, symbol: str, timeframe: str, candles, source="rest") -> Future:
+        """Queue bulk_insert_candles on the writer pool; the future yields the row count."""
+        return self.executor.submit(self.bulk_insert_candles, symbol, timeframe, candles, source)
+
     # ------------------------------------------------------------------
     # Cleanup
     # ------------------------------------------------------------------
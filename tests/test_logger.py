@@ -0,0 +1,63 @@
+"""Tests for symbol log files surviving interpreter exit."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def _run_and_read(tmp_path, body: str, symbol: str = "BTCUSDT") -> str:
+    """Run `body` in a fresh interpreter logging to `tmp_path`, return the symbol file."""
+    script = textwrap.dedent(
+        """
+        from trading_bot.core.logger import get_symbol_logger
+        log = get_symbol_logger({symbol!r})
+        """
+    ).format(symbol=symbol) + textwrap.dedent(body)
+
+    env = dict(os.environ, LOGS_DIR=str(tmp_path), LOG_LEVEL="INFO")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True)
+
+    files = list(tmp_path.glob(f"{symbol}_*.log"))
+    assert len(files) == 1, files
+    return files[0].read_text(encoding="utf-8")
+
+
+def test_symbol_logger_writes_buffered_records_on_exit(tmp_path):
+    """Records still buffered when the process exits reach the symbol file."""
+    content = _run_and_read(
+        tmp_path,
+        """
+        log.info("one")
+        log.info("two")
+        log.info("three")
+        """,
+    )
+
+    lines = content.splitlines()
+    assert len(lines) == 3
+    assert [line.rsplit(" ", 1)[-1] for line in lines] == ["one", "two", "three"]
+    assert all("[trading-bot.BTCUSDT]" in line for line in lines)
+
+
+def test_symbol_logger_keeps_records_logged_after_a_flush(tmp_path):
+    """Records buffered after the file handler exists are not lost at shutdown."""
+    content = _run_and_read(
+        tmp_path,
+        """
+        log.info("first")
+        for handler in log.handlers:
+            handler.flush()
+        log.info("second")
+        log.error("third")
+        log.info("fourth")
+        """,
+    )
+
+    assert [line.rsplit(" ", 1)[-1] for line in content.splitlines()] == [
+        "first", "second", "third", "fourth",
+    ]
@@ -0,0 +1,137 @@
+"""Offline tests for RestClient kline dedupe, ordering and array conversion.
+
+`session.get` is stubbed, so no request leaves the process.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trading_bot.config.app import load_app_config
+from trading_bot.api.rest_client import RestClient
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "app.yml"
+
+H1 = 3600  # 1h interval in seconds
+
+
+def kline(open_ts: int, close: float = 1.0, tf_sec: int = H1) -> list:
+    """Raw Binance kline row for a candle opening at `open_ts` (seconds)."""
+    return [
+        open_ts * 1000, "1.0", "2.0", "0.5", str(close), "10.0",
+        (open_ts + tf_sec) * 1000 - 1, "10.0", 5, "4.0", "4.0", "0",
+    ]
+
+
+class _Response:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, rows):
+        self.content = json.dumps(rows).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+class _StubSession:
+    """Returns the queued pages in order and records the request params."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.params = []
+
+    def get(self, url, params=None, timeout=None):
+        self.params.append(dict(params))
+        return _Response(self.pages.pop(0) if self.pages else [])
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_client():
+    def _make(pages):
+        client = RestClient(load_app_config(str(CONFIG_PATH)))
+        client.per_request_delay = 0
+        client.session = _StubSession(pages)
+        return client
+    return _make
+
+
+def _open_ts(candles):
+    return [c["open_ts"] for c in candles]
+
+
+def test_duplicate_and_out_of_order_pages(make_client):
+    """Overlapping, unordered pages come back unique, ascending, last row winning."""
+    base = 1000 * H1
+    # Backwards pagination: newest page first, rows inside a page reversed,
+    # and the second page overlaps the first by two candles
+    page1 = [kline(base + i * H1, close=1.0) for i in reversed(range(1000, 2000))]
+    page2 = [kline(base + i * H1, close=2.0) for i in reversed(range(500, 1002))]
+    client = make_client([page1, page2])
+
+    candles = client.fetch_klines("BTCUSDT", "1h", limit=1500, now=base + 2000 * H1)
+
+    assert _open_ts(candles) == [base + i * H1 for i in range(500, 2000)]
+    # Duplicated open_ts keep the row seen last (the second page)
+    by_ts = {c["open_ts"]: c["close"] for c in candles}
+    assert by_ts[base + 1000 * H1] == 2.0
+    assert by_ts[base + 1001 * H1] == 2.0
+    assert by_ts[base + 1002 * H1] == 1.0
+
+
+def test_misaligned_rows_are_kept_in_order(make_client):
+    """A candle off the interval boundary is reported, not dropped."""
+    rows = [kline(10 * H1), kline(12 * H1), kline(11 * H1 + 60), kline(13 * H1)]
+    client = make_client([rows])
+
+    candles = client.fetch_klines("BTCUSDT", "1h", limit=10)
+
+    assert _open_ts(candles) == [10 * H1, 11 * H1 + 60, 12 * H1, 13 * H1]
+
+
+def test_limit_keeps_newest_candles(make_client):
+    """More rows than `limit` are trimmed to the newest, on both fast and slow paths."""
+    aligned = [kline(i * H1) for i in range(10, 20)]
+    client = make_client([aligned])
+    assert _open_ts(client.fetch_klines("BTCUSDT", "1h", limit=4)) == [i * H1 for i in range(16, 20)]
+
+    shuffled = aligned[::2] + aligned[1::2] + aligned[:3]
+    client = make_client([shuffled])
+    assert _open_ts(client.fetch_klines("BTCUSDT", "1h", limit=4)) == [i * H1 for i in range(16, 20)]
+
+
+def test_malformed_row_falls_back_to_dict_path(make_client):
+    """An unparsable row is skipped by the array path via per-row normalization."""
+    rows = [kline(i * H1) for i in range(10, 15)]
+    rows[2] = [rows[2][0], "not-a-price"] + rows[2][2:]
+    client = make_client([rows])
+
+    arr = client.fetch_klines_array("BTCUSDT", "1h", limit=10)
+
+    assert arr["open_ts"].tolist() == [10 * H1, 11 * H1, 13 * H1, 14 * H1]
+    assert arr["close"].tolist() == [1.0] * 4
+
+
+def test_fetch_klines_and_array_match(make_client):
+    """The dict and structured-array fetches return the same candles."""
+    rows = [kline(i * H1, close=float(i)) for i in (14, 10, 12, 11, 12, 13)]
+    dicts = make_client([rows]).fetch_klines("BTCUSDT", "1h", limit=4)
+    arr = make_client([rows]).fetch_klines_array("BTCUSDT", "1h", limit=4)
+
+    assert arr["open_ts"].tolist() == _open_ts(dicts)
+    for name in ("close_ts", "open", "high", "low", "close", "volume"):
+        assert np.array_equal(arr[name], [c[name] for c in dicts]), name
+
+
+def test_now_pins_single_request_end_time(make_client):
+    """`now` sets endTime on a single (limit <= 1000) request too."""
+    client = make_client([[kline(H1)]])
+
+    client.fetch_klines_array("BTCUSDT", "1h", limit=1000, now=2 * H1 + 5)
+
+    assert client.session.params[0]["endTime"] == 2 * H1 * 1000